@@ -1,5 +1,6 @@
 import django.apps
 from django.conf import settings
+from django.db.backends.signals import connection_created
 from django.db.models.signals import post_migrate
 
 
@@ -9,14 +10,25 @@ def install(**kwargs):
     pgtrigger.install()
 
 
+def reset_ignore_func_installed(connection, **kwargs):
+    """
+    Ensures the function for ignoring triggers is re-installed on new
+    connections
+    """
+    connection.pgtrigger_ignore_func_installed = False
+
+
 class PGTriggerConfig(django.apps.AppConfig):
     name = 'pgtrigger'
 
     def ready(self):
         """
         Install pgplus triggers in a post_migrate hook if any are
-        configured.
+        configured. Track installation of the ignore function for
+        every new connection.
         """
+        connection_created.connect(reset_ignore_func_installed)
+
         if getattr(  # pragma: no branch
             settings, 'PGTRIGGER_INSTALL_ON_MIGRATE', True
         ):
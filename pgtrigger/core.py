@@ -1,11 +1,14 @@
 import contextlib
 import copy
+import functools
 import hashlib
 import logging
+import re
 import threading
 
 from django.db import connection
 from django.db import models
+from django.db import transaction
 from django.db.models.expressions import Col
 from django.db.models.fields.related import RelatedField
 from django.db.models.sql import Query
@@ -17,6 +20,20 @@ import pgconnection
 LOGGER = logging.getLogger('pgtrigger')
 _unset = object()
 
+# Quoted OLD and NEW row references rendered by the Q object
+_OLD_NEW_RE = re.compile(r'"(OLD|NEW)"')
+
+# The clause that dynamically ignores the execution of a trigger
+_IGNORE_CLAUSE = '''
+            IF (_pgtrigger_should_ignore(TG_TABLE_NAME, TG_NAME) IS TRUE) THEN
+                IF (TG_OP = 'DELETE') THEN
+                    RETURN OLD;
+                ELSE
+                    RETURN NEW;
+                END IF;
+            END IF;
+        '''
+
 # Installation states for a triggers
 INSTALLED = 'INSTALLED'
 UNINSTALLED = 'UNINSTALLED'
@@ -27,8 +44,35 @@ PRUNE = 'PRUNE'
 # All registered triggers for each model
 registry = {}
 
+
+class _Ignore(threading.local):
+    """
+    Tracks the triggers currently being ignored in a thread along with the
+    SQL that sets the pgtrigger.ignore variable for them
+    """
+
+    def __init__(self):
+        self.value = set()
+        self.sql_prefix = ''
+
+    def _render_sql_prefix(self):
+        self.sql_prefix = (
+            'SET LOCAL pgtrigger.ignore=\'{'
+            + ','.join(sorted(self.value))
+            + '}\';'
+        )
+
+    def add(self, ignore_uri):
+        self.value.add(ignore_uri)
+        self._render_sql_prefix()
+
+    def remove(self, ignore_uri):
+        self.value.remove(ignore_uri)
+        self._render_sql_prefix()
+
+
 # All triggers currently being ignored
-_ignore = threading.local()
+_ignore = _Ignore()
 
 
 def _is_concurrent_statement(sql):
@@ -45,7 +89,10 @@ def _inject_pgtrigger_ignore(sql, sql_vars, cursor):  # pragma: no cover
     variable in the executed SQL. This lets other triggers know when
     they should ignore execution
     """
-    if cursor.name:
+    if not _ignore.value:
+        # Nothing is being ignored in this thread, so leave the SQL as-is
+        return None
+    elif cursor.name:
         # A named cursor automatically prepends
         # "NO SCROLL CURSOR WITHOUT HOLD FOR" to the query, which
         # causes invalid SQL to be generated. There is no way
@@ -61,11 +108,7 @@ def _inject_pgtrigger_ignore(sql, sql_vars, cursor):  # pragma: no cover
         # setting. Ignore this specific statement for now
         return None
 
-    sql = (
-        'SET LOCAL pgtrigger.ignore=\'{' + ','.join(_ignore.value) + '}\';'
-    ) + sql
-
-    return sql, sql_vars
+    return _ignore.sql_prefix + sql, sql_vars
 
 
 def register(*triggers):
@@ -110,7 +153,6 @@ class Referencing:
         self.old = old
         self.new = new
 
-    def __str__(self):
         ref = 'REFERENCING'
         if self.old:
             ref += f' OLD TABLE AS {self.old} '
@@ -118,7 +160,10 @@ class Referencing:
         if self.new:
             ref += f' NEW TABLE AS {self.new} '
 
-        return ref
+        self._str = ref
+
+    def __str__(self):
+        return self._str
 
 
 class _When:
@@ -153,9 +198,9 @@ class _Operation:
 class _Operations(_Operation):
     def __init__(self, *operations):
         self.operations = operations
-
-    def __str__(self):
-        return ' OR '.join(str(operation) for operation in self.operations)
+        super().__init__(
+            ' OR '.join(str(operation) for operation in self.operations)
+        )
 
 
 #: For specifying "UPDATE" in the "operation" clause of a trigger
@@ -178,10 +223,8 @@ class UpdateOf(_Operation):
         if not columns:
             raise ValueError('Must provide at least one column')
 
-        self.columns = ', '.join(f'"{col}"' for col in columns)
-
-    def __str__(self):
-        return f'UPDATE OF {self.columns}'
+        self.columns = '"' + '", "'.join(columns) + '"'
+        super().__init__(f'UPDATE OF {self.columns}')
 
 
 class Condition:
@@ -210,7 +253,8 @@ class _OldNewQuery(Query):
         # DISTINCT FROM is a comnpletely valid lookup. Trick django into
         # being able to apply this lookup to related fields.
         if lookups == ['df'] and isinstance(lhs.output_field, RelatedField):
-            lhs = copy.deepcopy(lhs)
+            # Only the output field is rebound, so a shallow copy is enough
+            lhs = copy.copy(lhs)
             lhs.output_field = models.IntegerField(null=lhs.output_field.null)
 
         return super().build_lookup(lookups, lhs, rhs)
@@ -306,26 +350,68 @@ class Q(models.Q, Condition):
     """
 
     def resolve(self, model):
-        query = _OldNewQuery(model)
-        sql = (
-            connection.cursor()
-            .mogrify(
-                *self.resolve_expression(query).as_sql(
-                    compiler=query.get_compiler('default'),
-                    connection=connection,
+        # Conditions are static, so they are only resolved once per model
+        resolved = self.__dict__.setdefault('_resolved', {})
+        if model not in resolved:
+            query = _OldNewQuery(model)
+            sql = (
+                connection.cursor()
+                .mogrify(
+                    *self.resolve_expression(query).as_sql(
+                        compiler=query.get_compiler('default'),
+                        connection=connection,
+                    )
                 )
+                .decode()
             )
-            .decode()
-            .replace('"OLD"', 'OLD')
-            .replace('"NEW"', 'NEW')
-        )
+            resolved[model] = _OLD_NEW_RE.sub(r'\1', sql)
 
-        return sql
+        return resolved[model]
 
 
-def _drop_trigger(table, trigger_pgid):
-    with connection.cursor() as cursor:
-        cursor.execute(f'DROP TRIGGER IF EXISTS {trigger_pgid} ON {table};')
+def _render_drop_trigger(table, trigger_pgid):
+    return f'DROP TRIGGER IF EXISTS {trigger_pgid} ON {table};'
+
+
+@contextlib.contextmanager
+def _cursor(cursor=None):
+    """
+    Uses the provided cursor or opens a new one. Allows bulk operations to
+    share one cursor across all triggers
+    """
+    if cursor is not None:
+        yield cursor
+    else:
+        with connection.cursor() as cursor:
+            yield cursor
+
+
+def _execute_batch(sql_statements, cursor=None):
+    """
+    Executes SQL statements in a single round trip to the database
+    """
+    if sql_statements:
+        with _cursor(cursor) as cursor:
+            cursor.execute(';\n'.join(sql_statements))
+
+
+def _cache_by_uri(method):
+    """
+    Caches the results of a trigger method for every model URI.
+    Used to render SQL only once for triggers bound to a model
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, model):
+        # Created lazily so that subclasses can skip Trigger.__init__
+        cache = self.__dict__.setdefault('_cache', {})
+        key = (method.__name__, self.get_uri(model))
+        if key not in cache:
+            cache[key] = method(self, model)
+
+        return cache[key]
+
+    return wrapper
 
 
 # Allows Trigger methods to be used as context managers, mostly for
@@ -394,6 +480,7 @@ class Trigger:
     def __str__(self):
         return self.name
 
+    @_cache_by_uri
     def get_pgid(self, model):
         """The ID of the trigger and function object in postgres
 
@@ -460,7 +547,7 @@ class Trigger:
                     ' Use a different name for the trigger.'
                 )
 
-            registry[self.get_uri(model)] = (model, self)
+            registry[uri] = (model, self)
 
         return _cleanup_on_exit(lambda: self.unregister(*models))
 
@@ -471,6 +558,7 @@ class Trigger:
 
         return _cleanup_on_exit(lambda: self.register(*models))
 
+    @_cache_by_uri
     def render_condition(self, model):
         """Renders the condition SQL in the trigger declaration"""
         condition = self.get_condition(model)
@@ -497,18 +585,12 @@ class Trigger:
 
     def render_ignore(self, model):
         """
-        Renders the clause that can dynamically ignore the trigger's execution
+        Renders the clause that can dynamically ignore the trigger's execution.
+        The clause is the same for every trigger and model
         """
-        return '''
-            IF (_pgtrigger_should_ignore(TG_TABLE_NAME, TG_NAME) IS TRUE) THEN
-                IF (TG_OP = 'DELETE') THEN
-                    RETURN OLD;
-                ELSE
-                    RETURN NEW;
-                END IF;
-            END IF;
-        '''
+        return _IGNORE_CLAUSE
 
+    @_cache_by_uri
     def render_func(self, model):
         """Renders the trigger function SQL statement"""
         return f'''
@@ -522,22 +604,35 @@ class Trigger:
             $$ LANGUAGE plpgsql;
         '''
 
+    @_cache_by_uri
     def render_trigger(self, model):
-        """Renders the trigger declaration SQL statement"""
+        """Renders the trigger declaration SQL statement
+
+        Postgres 14 and up natively supports replacing triggers. Older
+        versions wrap the trigger creation in a block that ignores
+        errors if the trigger already exists.
+        """
         table = model._meta.db_table
         pgid = self.get_pgid(model)
-        return f'''
-            DO $$ BEGIN
-                CREATE TRIGGER {pgid}
-                    {self.when} {self.operation} ON {table}
-                    {self.referencing or ''}
-                    FOR EACH {self.level} {self.render_condition(model)}
-                    EXECUTE PROCEDURE {pgid}();
-            EXCEPTION
-                -- Ignore issues if the trigger already exists
-                WHEN others THEN null;
-            END $$;
+        replace = connection.pg_version >= 140000
+        rendered = f'''
+            CREATE {'OR REPLACE ' if replace else ''}TRIGGER {pgid}
+                {self.when} {self.operation} ON {table}
+                {self.referencing or ''}
+                FOR EACH {self.level} {self.render_condition(model)}
+                EXECUTE PROCEDURE {pgid}();
         '''
+        if replace:
+            return rendered
+        else:
+            return f'''
+                DO $$ BEGIN
+                    {rendered}
+                EXCEPTION
+                    -- Ignore issues if the trigger already exists
+                    WHEN others THEN null;
+                END $$;
+            '''
 
     def render_comment(self, model):
         """Renders the trigger commment SQL statement
@@ -550,7 +645,33 @@ class Trigger:
         table = model._meta.db_table
         return f'COMMENT ON TRIGGER {pgid} ON {table} IS \'{hash}\''
 
-    def get_installation_status(self, model):
+    def render_install(self, model):
+        """Renders all SQL statements for installing the trigger"""
+        return [
+            self.render_func(model),
+            self.render_trigger(model),
+            self.render_comment(model),
+        ]
+
+    def render_uninstall(self, model):
+        """Renders the SQL statement for uninstalling the trigger"""
+        return _render_drop_trigger(model._meta.db_table, self.get_pgid(model))
+
+    def render_enable(self, model):
+        """Renders the SQL statement for enabling the trigger"""
+        return (
+            f'ALTER TABLE {model._meta.db_table} ENABLE TRIGGER'
+            f' {self.get_pgid(model)};'
+        )
+
+    def render_disable(self, model):
+        """Renders the SQL statement for disabling the trigger"""
+        return (
+            f'ALTER TABLE {model._meta.db_table} DISABLE TRIGGER'
+            f' {self.get_pgid(model)};'
+        )
+
+    def get_installation_status(self, model, cursor=None):
         """Returns the installation status of a trigger.
 
         The return type is (status, enabled), where status is one of:
@@ -562,6 +683,8 @@ class Trigger:
 
         "enabled" is True if the trigger is installed and enabled or false
         if installed and disabled (or uninstalled).
+
+        An open cursor may be provided when checking many triggers.
         """
         trigger_exists_sql = f'''
             SELECT oid, obj_description(oid) AS hash, tgenabled AS enabled
@@ -570,7 +693,7 @@ class Trigger:
                   AND tgrelid='{model._meta.db_table}'::regclass;
         '''
         try:
-            with connection.cursor() as cursor:
+            with _cursor(cursor) as cursor:
                 cursor.execute(trigger_exists_sql)
                 results = cursor.fetchall()
         except ProgrammingError:  # pragma: no cover
@@ -589,15 +712,16 @@ class Trigger:
             else:
                 return (INSTALLED, results[0][2] == 'O')
 
+    @_cache_by_uri
     def get_hash(self, model):
         """
         Computes a hash for the trigger, which is used to
         uniquely identify its contents. The hash is computed based
         on the trigger function and declaration.
 
-        Note: If the trigger definition includes dynamic data, such
-        as the current time, the trigger hash will always change and
-        appear to be out of sync.
+        Note: The trigger function and declaration are only rendered
+        once per model, so dynamic data in a trigger definition, such as
+        the current time, is fixed at the time of the first render.
         """
         rendered_func = self.render_func(model)
         rendered_trigger = self.render_trigger(model)
@@ -611,20 +735,13 @@ class Trigger:
         # Ensure we have the function to ignore execution of triggers
         install_ignore_func()
 
-        rendered_func = self.render_func(model)
-        rendered_trigger = self.render_trigger(model)
-        rendered_comment = self.render_comment(model)
-
-        with connection.cursor() as cursor:
-            cursor.execute(rendered_func)
-            cursor.execute(rendered_trigger)
-            cursor.execute(rendered_comment)
+        _execute_batch(_render_install([(model, self)]))
 
         return _cleanup_on_exit(lambda: self.uninstall(model))
 
     def uninstall(self, model):
         """Uninstalls the trigger for a model"""
-        _drop_trigger(model._meta.db_table, self.get_pgid(model))
+        _execute_batch([self.render_uninstall(model)])
 
         return _cleanup_on_exit(  # pragma: no branch
             lambda: self.install(model)
@@ -632,11 +749,7 @@ class Trigger:
 
     def enable(self, model):
         """Enables the trigger for a model"""
-        with connection.cursor() as cursor:
-            cursor.execute(
-                f'ALTER TABLE {model._meta.db_table} ENABLE TRIGGER'
-                f' {self.get_pgid(model)};'
-            )
+        _execute_batch([self.render_enable(model)])
 
         return _cleanup_on_exit(  # pragma: no branch
             lambda: self.disable(model)
@@ -644,11 +757,7 @@ class Trigger:
 
     def disable(self, model):
         """Disables the trigger for a model"""
-        with connection.cursor() as cursor:
-            cursor.execute(
-                f'ALTER TABLE {model._meta.db_table} DISABLE TRIGGER'
-                f' {self.get_pgid(model)};'
-            )
+        _execute_batch([self.render_disable(model)])
 
         return _cleanup_on_exit(  # pragma: no branch
             lambda: self.enable(model)
@@ -663,9 +772,6 @@ class Trigger:
             # trigger.
             ignore_uri = f'{model._meta.db_table}:{self.get_pgid(model)}'
 
-            if not hasattr(_ignore, 'value'):
-                _ignore.value = set()
-
             if not _ignore.value:
                 # If this is the first time we are ignoring trigger execution,
                 # register the pre_execute_hook
@@ -675,10 +781,10 @@ class Trigger:
 
             if ignore_uri not in _ignore.value:
                 try:
-                    _ignore.value.add(ignore_uri)
+                    _ignore.add(ignore_uri)
                     yield
                 finally:
-                    _ignore.value.remove(ignore_uri)
+                    _ignore.remove(ignore_uri)
             else:  # The trigger is already being ignored
                 yield
 
@@ -730,6 +836,7 @@ class FSM(Trigger):
         return [('_is_valid_transition', 'BOOLEAN')]
 
     def get_func(self, model):
+        # Rendered functions are cached, so this only runs once per model
         col = model._meta.get_field(self.field).column
         transition_uris = (
             '{'
@@ -781,20 +888,19 @@ class SoftDelete(Trigger):
         super().__init__(name=name, condition=condition)
 
     def get_func(self, model):
+        # Rendered functions are cached, so this only runs once per model
         soft_field = model._meta.get_field(self.field).column
         pk_col = model._meta.pk.column
-
-        def _render_value():
-            if self.value is None:
-                return 'NULL'
-            elif isinstance(self.value, str):
-                return f"'{self.value}'"
-            else:
-                return str(self.value)
+        if self.value is None:
+            rendered_value = 'NULL'
+        elif isinstance(self.value, str):
+            rendered_value = f"'{self.value}'"
+        else:
+            rendered_value = str(self.value)
 
         return f'''
             UPDATE {model._meta.db_table}
-            SET {soft_field} = {_render_value()}
+            SET {soft_field} = {rendered_value}
             WHERE "{pk_col}" = OLD."{pk_col}";
             RETURN NULL;
         '''
@@ -806,22 +912,69 @@ def get(*uris):
 
     A URI is in the format of "app_label.model_name:trigger_name"
     """
-    if uris:
-        for uri in uris:
-            if uri and len(uri.split(':')) == 1:
-                raise ValueError(
-                    'Trigger URI must be in the format of'
-                    ' "app_label.model_name:trigger_name"'
-                )
-            elif uri and uri not in registry:
-                raise ValueError(
-                    f'URI "{uri}" not found in pgtrigger registry'
-                )
-
-        return [registry[uri] for uri in uris]
-    else:
+    if not uris:
         return list(registry.values())
 
+    model_triggers = []
+    for uri in uris:
+        if uri and ':' not in uri:
+            raise ValueError(
+                'Trigger URI must be in the format of'
+                ' "app_label.model_name:trigger_name"'
+            )
+        elif uri and uri not in registry:
+            raise ValueError(f'URI "{uri}" not found in pgtrigger registry')
+
+        model_triggers.append(registry[uri])
+
+    return model_triggers
+
+
+def _get_disabled(model_triggers, cursor=None):
+    """
+    Returns the (table, trigger) names of disabled triggers.
+
+    Replacing a trigger on Postgres 14 and up enables it, so installation
+    disables these triggers again. Older versions never replace an
+    installed trigger, so nothing is looked up for them
+    """
+    if not model_triggers or connection.pg_version < 140000:
+        return set()
+
+    installed = [
+        (model._meta.db_table, trigger.get_pgid(model))
+        for model, trigger in model_triggers
+    ]
+    sql = (
+        'SELECT tgrelid::regclass::text, tgname::text'
+        '    FROM pg_trigger'
+        '    WHERE tgenabled = %s'
+        '    AND (tgrelid::regclass::text, tgname::text) IN (VALUES '
+        + ', '.join(['(%s, %s)'] * len(installed))
+        + ')'
+    )
+    sql_vars = ['D']
+    sql_vars.extend(value for pair in installed for value in pair)
+
+    with _cursor(cursor) as cursor:
+        cursor.execute(sql, sql_vars)
+        return set(cursor.fetchall())
+
+
+def _render_install(model_triggers, cursor=None):
+    """
+    Renders all SQL statements for installing triggers. Disabled triggers
+    are disabled again after they are installed
+    """
+    disabled = _get_disabled(model_triggers, cursor=cursor)
+    sql_statements = []
+    for model, trigger in model_triggers:
+        sql_statements.extend(trigger.render_install(model))
+        if (model._meta.db_table, trigger.get_pgid(model)) in disabled:
+            sql_statements.append(trigger.render_disable(model))
+
+    return sql_statements
+
 
 def install(*uris):
     """
@@ -829,60 +982,97 @@ def install(*uris):
     provided. If URIs aren't provided, prune any orphaned triggers from the
     database
     """
-    if uris:
-        model_triggers = get(*uris)
-    else:
-        model_triggers = [
-            (model, trigger)
-            for model, trigger in get()
-            if trigger.get_installation_status(model)[0] != INSTALLED
-        ]
+    with connection.cursor() as cursor:
+        if uris:
+            model_triggers = get(*uris)
+        else:
+            model_triggers = [
+                (model, trigger)
+                for model, trigger in get()
+                if trigger.get_installation_status(model, cursor=cursor)[0]
+                != INSTALLED
+            ]
+
+        if model_triggers:
+            # Ensure we have the function to ignore execution of triggers
+            install_ignore_func(cursor=cursor)
+
+        for model, trigger in model_triggers:
+            LOGGER.info(
+                f'pgtrigger: Installing "{trigger}" trigger'
+                f' for {model._meta.db_table} table.'
+            )
 
-    for model, trigger in model_triggers:
-        LOGGER.info(
-            f'pgtrigger: Installing "{trigger}" trigger'
-            f' for {model._meta.db_table} table.'
+        _execute_batch(
+            _render_install(model_triggers, cursor=cursor), cursor=cursor
         )
-        trigger.install(model)
 
-    if not uris:  # pragma: no branch
-        prune()
+        if not uris:  # pragma: no branch
+            _prune(cursor)
 
 
-def get_prune_list():
-    """Return triggers that will be pruned upon next full install"""
+def _get_prune_list(cursor):
+    # Orphaned triggers are computed in the database by excluding the
+    # table / trigger names of all registered triggers
     installed = {
         (model._meta.db_table, trigger.get_pgid(model))
         for model, trigger in get()
     }
-
-    with connection.cursor() as cursor:
-        cursor.execute(
-            'SELECT tgrelid::regclass, tgname, tgenabled'
-            '    FROM pg_trigger'
-            '    WHERE tgname LIKE \'pgtrigger_%\''
+    sql = (
+        'SELECT tgrelid::regclass, tgname, tgenabled'
+        '    FROM pg_trigger'
+        '    WHERE tgname LIKE %s'
+    )
+    sql_vars = ['pgtrigger_%']
+    if installed:
+        sql += (
+            '    AND (tgrelid::regclass::text, tgname::text) NOT IN (VALUES '
+            + ', '.join(['(%s, %s)'] * len(installed))
+            + ')'
         )
-        triggers = set(cursor.fetchall())
+        sql_vars.extend(value for pair in installed for value in pair)
+
+    cursor.execute(sql, sql_vars)
 
     return [
         (trigger[0], trigger[1], trigger[2] == 'O')
-        for trigger in triggers
-        if (trigger[0], trigger[1]) not in installed
+        for trigger in cursor.fetchall()
     ]
 
 
+def get_prune_list():
+    """Return triggers that will be pruned upon next full install"""
+    with connection.cursor() as cursor:
+        return _get_prune_list(cursor)
+
+
+def _prune(cursor):
+    prune_list = _get_prune_list(cursor)
+    if prune_list:
+        LOGGER.info(
+            f'pgtrigger: Pruning {len(prune_list)} trigger(s): '
+            + ', '.join(
+                f'{trigger[1]} from table {trigger[0]}'
+                for trigger in prune_list
+            )
+        )
+        _execute_batch(
+            [
+                _render_drop_trigger(trigger[0], trigger[1])
+                for trigger in prune_list
+            ],
+            cursor=cursor,
+        )
+
+
 def prune():
     """
     Remove any pgtrigger triggers in the database that are not used by models.
     I.e. if a model or trigger definition is deleted from a model, ensure
     it is removed from the database
     """
-    for trigger in get_prune_list():
-        LOGGER.info(
-            f'pgtrigger: Pruning trigger {trigger[1]}'
-            f' from table {trigger[0]}...'
-        )
-        _drop_trigger(trigger[0], trigger[1])
+    with connection.cursor() as cursor:
+        _prune(cursor)
 
 
 def enable(*uris):
@@ -890,21 +1080,26 @@ def enable(*uris):
     Enables registered triggers matching URIs or all triggers if no URIs
     are provided
     """
-    if uris:
-        model_triggers = get(*uris)
-    else:
-        model_triggers = [
-            (model, trigger)
-            for model, trigger in get()
-            if trigger.get_installation_status(model)[1] is False
-        ]
+    with connection.cursor() as cursor:
+        if uris:
+            model_triggers = get(*uris)
+        else:
+            model_triggers = [
+                (model, trigger)
+                for model, trigger in get()
+                if trigger.get_installation_status(model, cursor=cursor)[1]
+                is False
+            ]
+
+        sql_statements = []
+        for model, trigger in model_triggers:
+            LOGGER.info(
+                f'pgtrigger: Enabling "{trigger}" trigger'
+                f' for {model._meta.db_table} table.'
+            )
+            sql_statements.append(trigger.render_enable(model))
 
-    for model, trigger in model_triggers:
-        LOGGER.info(
-            f'pgtrigger: Enabling "{trigger}" trigger'
-            f' for {model._meta.db_table} table.'
-        )
-        trigger.enable(model)
+        _execute_batch(sql_statements, cursor=cursor)
 
 
 def uninstall(*uris):
@@ -916,24 +1111,29 @@ def uninstall(*uris):
     Running migrations will re-install any existing triggers. This
     behavior is overridable with ``settings.PGTRIGGER_INSTALL_ON_MIGRATE``
     """
-    if uris:
-        model_triggers = get(*uris)
-    else:
-        model_triggers = [
-            (model, trigger)
-            for model, trigger in get()
-            if trigger.get_installation_status(model)[0] != UNINSTALLED
-        ]
+    with connection.cursor() as cursor:
+        if uris:
+            model_triggers = get(*uris)
+        else:
+            model_triggers = [
+                (model, trigger)
+                for model, trigger in get()
+                if trigger.get_installation_status(model, cursor=cursor)[0]
+                != UNINSTALLED
+            ]
+
+        sql_statements = []
+        for model, trigger in model_triggers:
+            LOGGER.info(
+                f'pgtrigger: Uninstalling "{trigger}" trigger'
+                f' for {model._meta.db_table} table.'
+            )
+            sql_statements.append(trigger.render_uninstall(model))
 
-    for model, trigger in model_triggers:
-        LOGGER.info(
-            f'pgtrigger: Uninstalling "{trigger}" trigger'
-            f' for {model._meta.db_table} table.'
-        )
-        trigger.uninstall(model)
+        _execute_batch(sql_statements, cursor=cursor)
 
-    if not uris:
-        prune()
+        if not uris:
+            _prune(cursor)
 
 
 def disable(*uris):
@@ -941,21 +1141,25 @@ def disable(*uris):
     Disables registered triggers matching URIs or all triggers if no URIs are
     provided
     """
-    if uris:
-        model_triggers = get(*uris)
-    else:
-        model_triggers = [
-            (model, trigger)
-            for model, trigger in get()
-            if trigger.get_installation_status(model)[1]
-        ]
+    with connection.cursor() as cursor:
+        if uris:
+            model_triggers = get(*uris)
+        else:
+            model_triggers = [
+                (model, trigger)
+                for model, trigger in get()
+                if trigger.get_installation_status(model, cursor=cursor)[1]
+            ]
+
+        sql_statements = []
+        for model, trigger in model_triggers:
+            LOGGER.info(
+                f'pgtrigger: Disabling "{trigger}" trigger for'
+                f' {model._meta.db_table} table.'
+            )
+            sql_statements.append(trigger.render_disable(model))
 
-    for model, trigger in model_triggers:
-        LOGGER.info(
-            f'pgtrigger: Disabling "{trigger}" trigger for'
-            f' {model._meta.db_table} table.'
-        )
-        trigger.disable(model)
+        _execute_batch(sql_statements, cursor=cursor)
 
 
 @contextlib.contextmanager
@@ -973,39 +1177,54 @@ def ignore(*uris):
         yield
 
 
-def install_ignore_func():
+_IGNORE_FUNC_SQL = '''
+    CREATE OR REPLACE FUNCTION _pgtrigger_should_ignore(
+        table_name NAME,
+        trigger_name NAME
+    )
+    RETURNS BOOLEAN AS $$
+        DECLARE
+            _pgtrigger_ignore TEXT[];
+            _result BOOLEAN;
+        BEGIN
+            BEGIN
+                SELECT INTO _pgtrigger_ignore
+                    CURRENT_SETTING('pgtrigger.ignore');
+                EXCEPTION WHEN OTHERS THEN
+            END;
+            IF _pgtrigger_ignore IS NOT NULL THEN
+                SELECT CONCAT(table_name, ':', trigger_name) = ANY(_pgtrigger_ignore)
+                INTO _result;
+                RETURN _result;
+            ELSE
+                RETURN FALSE;
+            END IF;
+        END;
+    $$ LANGUAGE plpgsql;
+'''
+
+
+def install_ignore_func(cursor=None):
     """
     pgtrigger uses a special postgres function to determine when a trigger
     should be ignored. This installs the function.
 
     This function is automatically installed when all triggers are installed
-    with pgtrigger.install()
+    with pgtrigger.install(). It is only installed once per connection.
     """
-    with connection.cursor() as cursor:
-        cursor.execute(
-            '''
-            CREATE OR REPLACE FUNCTION _pgtrigger_should_ignore(
-                table_name NAME,
-                trigger_name NAME
+    if getattr(connection, 'pgtrigger_ignore_func_installed', False):
+        return
+
+    _execute_batch([_IGNORE_FUNC_SQL], cursor=cursor)
+
+    # Only consider the function installed once it is committed. Rolled
+    # back transactions will also roll back the function. Manually
+    # managed transactions have no commit hooks, so nothing is cached
+    if connection.in_atomic_block:
+        transaction.on_commit(
+            lambda: setattr(
+                connection, 'pgtrigger_ignore_func_installed', True
             )
-            RETURNS BOOLEAN AS $$
-                DECLARE
-                    _pgtrigger_ignore TEXT[];
-                    _result BOOLEAN;
-                BEGIN
-                    BEGIN
-                        SELECT INTO _pgtrigger_ignore
-                            CURRENT_SETTING('pgtrigger.ignore');
-                        EXCEPTION WHEN OTHERS THEN
-                    END;
-                    IF _pgtrigger_ignore IS NOT NULL THEN
-                        SELECT CONCAT(table_name, ':', trigger_name) = ANY(_pgtrigger_ignore)
-                        INTO _result;
-                        RETURN _result;
-                    ELSE
-                        RETURN FALSE;
-                    END IF;
-                END;
-            $$ LANGUAGE plpgsql;
-            '''
         )
+    elif connection.get_autocommit():
+        connection.pgtrigger_ignore_func_installed = True
@@ -208,6 +208,44 @@ def test_outdated(capsys, mocker):
     ) in lines
 
 
+@pytest.mark.django_db
+def test_install_disabled(capsys, mocker):
+    """
+    Verifies installing a disabled trigger keeps it disabled
+    """
+    call_command('pgtrigger', 'disable', 'tests.SoftDelete:soft_delete')
+    call_command('pgtrigger', 'install', 'tests.SoftDelete:soft_delete')
+    call_command('pgtrigger', 'ls', 'tests.SoftDelete:soft_delete')
+
+    captured = capsys.readouterr()
+    lines = sorted(captured.out.split('\n'))
+    assert lines == [
+        '',
+        'tests.SoftDelete:soft_delete'
+        '\t\x1b[92mINSTALLED\x1b[0m'
+        '\t\x1b[91mDISABLED\x1b[0m',
+    ]
+
+    # Outdated triggers that are disabled stay disabled when installing
+    # all triggers
+    mocker.patch.object(
+        core.registry['tests.SoftDelete:soft_delete'][1],
+        'get_hash',
+        return_value='hash',
+    )
+    call_command('pgtrigger', 'install')
+    call_command('pgtrigger', 'ls', 'tests.SoftDelete:soft_delete')
+
+    captured = capsys.readouterr()
+    lines = sorted(captured.out.split('\n'))
+    assert lines == [
+        '',
+        'tests.SoftDelete:soft_delete'
+        '\t\x1b[92mINSTALLED\x1b[0m'
+        '\t\x1b[91mDISABLED\x1b[0m',
+    ]
+
+
 @pytest.mark.django_db
 def test_main_commands_w_args(capsys):
     """
@@ -2,7 +2,12 @@ import datetime as dt
 
 import ddf
 from django.contrib.auth.models import User
+from django.db import connection
+from django.db import models as django_models
+from django.db import transaction
+from django.db.models.expressions import Col
 from django.db.utils import InternalError
+from django.test.utils import CaptureQueriesContext
 import pytest
 
 import pgtrigger.core
@@ -101,6 +106,33 @@ def test_soft_delete_different_values():
         assert models.LogEntry.objects.get().old_field is None
 
 
+def test_class_attribute_triggers():
+    """
+    Verifies SoftDelete and FSM triggers can be configured with class
+    attributes by subclasses that skip __init__
+    """
+
+    class InactiveSoftDelete(pgtrigger.SoftDelete):
+        field = 'level'
+        value = 'inactive'
+
+        def __init__(self):
+            pass
+
+    rendered = InactiveSoftDelete().get_func(models.LogEntry)
+    assert "SET level = 'inactive'" in rendered
+
+    class PublishFSM(pgtrigger.FSM):
+        field = 'transition'
+        transitions = [('unpublished', 'published')]
+
+        def __init__(self):
+            pass
+
+    rendered = PublishFSM().get_func(models.FSM)
+    assert "ANY('{unpublished:published}'::text[])" in rendered
+
+
 @pytest.mark.django_db(transaction=True)
 def test_fsm():
     """
@@ -226,6 +258,24 @@ def test_is_distinct_from_condition_fk_field():
         test_char_fk_model.save()
 
 
+def test_is_distinct_from_lookup_fk_field():
+    """
+    Verifies building a distinct from lookup on a foreign key field does
+    not alter the original column
+    """
+    fk_field = models.TestTrigger._meta.get_field('fk_field')
+    lhs = Col('OLD', fk_field)
+    rhs = Col('NEW', fk_field)
+
+    lookup = pgtrigger.core._OldNewQuery(models.TestTrigger).build_lookup(
+        ['df'], lhs, rhs
+    )
+    assert isinstance(lookup, pgtrigger.IsDistinctFrom)
+    assert isinstance(lookup.lhs.output_field, django_models.IntegerField)
+    assert lookup.lhs.target is fk_field
+    assert lhs.output_field is fk_field
+
+
 @pytest.mark.django_db(transaction=True)
 def test_is_not_distinct_from_condition():
     """Tests triggers where the old and new are not distinct from one another
@@ -265,6 +315,18 @@ def test_is_not_distinct_from_condition():
         test_model.save()
 
 
+@pytest.mark.django_db
+def test_q_resolve(mocker):
+    """Verifies Q conditions are resolved once per model"""
+    condition = pgtrigger.Q(old__int_field=0, new__int_field=1)
+    resolved = condition.resolve(models.TestModel)
+    assert resolved == '(NEW."int_field" = 1 AND OLD."int_field" = 0)'
+
+    old_new_query = mocker.spy(pgtrigger.core, '_OldNewQuery')
+    assert condition.resolve(models.TestModel) is resolved
+    assert not old_new_query.called
+
+
 @pytest.mark.django_db(transaction=True)
 def test_complex_conditions():
     """Tests complex OLD and NEW trigger conditions"""
@@ -411,6 +473,81 @@ def test_registry():
         pgtrigger.get('tests.TestMode')
 
 
+def test_get_pgid(mocker):
+    """Verifies postgres IDs are computed once per model"""
+    trigger = pgtrigger.Trigger(
+        name='test_pgid', when=pgtrigger.Before, operation=pgtrigger.Insert
+    )
+    sha1 = mocker.spy(pgtrigger.core.hashlib, 'sha1')
+
+    pgid = trigger.get_pgid(models.TestModel)
+    assert pgid.startswith('pgtrigger_test_pgid_')
+    assert trigger.get_pgid(models.TestModel) == pgid
+    assert sha1.call_count == 1
+
+    assert trigger.get_pgid(models.TestTrigger) != pgid
+    assert sha1.call_count == 2
+
+
+def test_render_caching(mocker):
+    """Verifies trigger SQL is only rendered once per model"""
+    trigger = pgtrigger.Trigger(
+        name='test_render',
+        when=pgtrigger.Before,
+        operation=pgtrigger.Insert,
+        func="RAISE EXCEPTION 'no no no!';",
+    )
+    get_func = mocker.spy(trigger, 'get_func')
+
+    rendered = trigger.render_func(models.TestModel)
+    assert 'no no no!' in rendered
+    assert trigger.render_func(models.TestModel) is rendered
+    assert get_func.call_count == 1
+
+    assert trigger.render_func(models.TestTrigger) != rendered
+    assert get_func.call_count == 2
+
+    # Plain conditions are also only rendered once
+    trigger.condition = pgtrigger.Condition('OLD.* IS DISTINCT FROM NEW.*')
+    resolve = mocker.spy(trigger.condition, 'resolve')
+    rendered = trigger.render_condition(models.TestModel)
+    assert rendered == 'WHEN (OLD.* IS DISTINCT FROM NEW.*)'
+    assert trigger.render_condition(models.TestModel) is rendered
+    assert resolve.call_count == 1
+
+    # Caching also works for subclasses that skip Trigger.__init__
+    class CustomTrigger(pgtrigger.Trigger):
+        name = 'custom'
+
+        def __init__(self):
+            pass
+
+    pgid = CustomTrigger().get_pgid(models.TestModel)
+    assert pgid.startswith('pgtrigger_custom_')
+
+
+@pytest.mark.django_db
+def test_render_trigger_pg_version(mocker):
+    """
+    Verifies triggers are replaced natively on newer versions of Postgres
+    """
+    mocker.patch.object(connection, 'pg_version', 140000)
+    trigger = pgtrigger.Protect(
+        name='test_render_trigger1', operation=pgtrigger.Delete
+    )
+    rendered = trigger.render_trigger(models.TestModel)
+    assert 'CREATE OR REPLACE TRIGGER' in rendered
+    assert 'EXCEPTION' not in rendered
+
+    mocker.patch.object(connection, 'pg_version', 130000)
+    trigger = pgtrigger.Protect(
+        name='test_render_trigger2', operation=pgtrigger.Delete
+    )
+    rendered = trigger.render_trigger(models.TestModel)
+    assert 'CREATE OR REPLACE TRIGGER' not in rendered
+    assert 'EXCEPTION' in rendered
+
+
 def test_operations():
     """Tests Operation objects and ORing them together"""
     assert str(pgtrigger.Update) == 'UPDATE'
@@ -479,6 +616,22 @@ def test_custom_trigger_definitions():
             test_model.save()
 
 
+@pytest.mark.django_db(transaction=True)
+def test_trigger_enable_disable():
+    """Verifies enabling and disabling an individual trigger"""
+    trigger = pgtrigger.core.registry['tests.TestTrigger:protect_delete'][1]
+    deletion_protected_model = ddf.G(models.TestTrigger)
+
+    with trigger.disable(models.TestTrigger):
+        # Reinstalling a disabled trigger keeps it disabled
+        trigger.install(models.TestTrigger)
+        deletion_protected_model.delete()
+
+    deletion_protected_model = ddf.G(models.TestTrigger)
+    with pytest.raises(InternalError, match='Cannot delete rows'):
+        deletion_protected_model.delete()
+
+
 @pytest.mark.django_db(transaction=True)
 def test_basic_ignore():
     """Verify basic dynamic ignore functionality"""
@@ -553,6 +706,27 @@ def test_multiple_ignores():
     assert not models.TestTrigger.objects.exists()
 
 
+def test_ignore_sql_prefix():
+    """
+    Verifies the SQL for setting ignored triggers is rendered as triggers
+    are added and removed
+    """
+    ignore = pgtrigger.core._Ignore()
+    assert ignore.sql_prefix == ''
+
+    ignore.add('table:trigger2')
+    ignore.add('table:trigger1')
+    assert (
+        ignore.sql_prefix
+        == 'SET LOCAL pgtrigger.ignore=\'{table:trigger1,table:trigger2}\';'
+    )
+
+    ignore.remove('table:trigger1')
+    assert (
+        ignore.sql_prefix == 'SET LOCAL pgtrigger.ignore=\'{table:trigger2}\';'
+    )
+
+
 @pytest.mark.django_db
 def test_protect():
     """Verify deletion protect trigger works on test model"""
@@ -665,6 +839,129 @@ def test_trigger_management(mocker):
         new_callable=mocker.PropertyMock,
         return_value='hi',
     )
-    pgtrigger.prune()
+    # Orphaned triggers are found and dropped in two round trips
+    with CaptureQueriesContext(connection) as queries:
+        pgtrigger.prune()
+    assert len(queries) == 2
     pgtrigger.prune()
     deletion_protected_model.delete()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batched_trigger_management():
+    """
+    Verifies managing multiple triggers happens in one database round trip
+    """
+    uris = ['tests.SoftDelete:soft_delete', 'tests.TestTrigger:protect_delete']
+    connection.ensure_connection()
+    pgtrigger.core.install_ignore_func()
+
+    for func in [
+        pgtrigger.disable,
+        pgtrigger.enable,
+        pgtrigger.uninstall,
+        pgtrigger.install,
+    ]:
+        with CaptureQueriesContext(connection) as queries:
+            func(*uris)
+
+        # Installing also looks up disabled triggers on Postgres 14 and up
+        num_queries = 1
+        if func is pgtrigger.install:
+            num_queries += connection.pg_version >= 140000
+        assert len(queries) == num_queries
+
+    deletion_protected_model = ddf.G(models.TestTrigger)
+    with pytest.raises(InternalError, match='Cannot delete rows'):
+        deletion_protected_model.delete()
+
+
+@pytest.mark.django_db
+def test_install_disabled_triggers(mocker):
+    """
+    Verifies disabled triggers are looked up in one query and are disabled
+    again when installed
+    """
+    model_triggers = pgtrigger.get(
+        'tests.SoftDelete:soft_delete', 'tests.TestTrigger:protect_delete'
+    )
+    model, trigger = model_triggers[0]
+    disabled = {(model._meta.db_table, trigger.get_pgid(model))}
+    pgtrigger.disable('tests.SoftDelete:soft_delete')
+
+    mocker.patch.object(connection, 'pg_version', 140000)
+    with CaptureQueriesContext(connection) as queries:
+        assert pgtrigger.core._get_disabled(model_triggers) == disabled
+    assert len(queries) == 1
+
+    # Older versions of Postgres never replace and enable triggers
+    mocker.patch.object(connection, 'pg_version', 130000)
+    with CaptureQueriesContext(connection) as queries:
+        assert not pgtrigger.core._get_disabled(model_triggers)
+    assert not queries
+
+    mocker.patch(
+        'pgtrigger.core._get_disabled', autospec=True, return_value=disabled
+    )
+    assert pgtrigger.core._render_install(model_triggers) == [
+        *trigger.render_install(model),
+        trigger.render_disable(model),
+        *model_triggers[1][1].render_install(model_triggers[1][0]),
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_install_ignore_func_once_per_connection():
+    """
+    Verifies the ignore function is only installed once for every connection
+    """
+    connection.ensure_connection()
+    pgtrigger.core.install_ignore_func()
+    with CaptureQueriesContext(connection) as queries:
+        pgtrigger.core.install_ignore_func()
+    assert not queries
+
+    # New connections should install the function again
+    connection.close()
+    connection.ensure_connection()
+    with CaptureQueriesContext(connection) as queries:
+        pgtrigger.core.install_ignore_func()
+    assert len(queries) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_install_ignore_func_manual_transaction():
+    """
+    Verifies the ignore function can be installed when transactions are
+    managed manually
+    """
+    connection.ensure_connection()
+    connection.pgtrigger_ignore_func_installed = False
+    transaction.set_autocommit(False)
+    try:
+        pgtrigger.core.install_ignore_func()
+
+        # The function is not cached since it may still be rolled back
+        assert not connection.pgtrigger_ignore_func_installed
+    finally:
+        transaction.rollback()
+        transaction.set_autocommit(True)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_trigger_management_cursors(mocker):
+    """
+    Verifies managing all triggers shares one cursor for each operation
+    """
+    pgtrigger.install()
+
+    cursor = mocker.spy(connection, 'cursor')
+    for func in [
+        pgtrigger.disable,
+        pgtrigger.enable,
+        pgtrigger.uninstall,
+        pgtrigger.install,
+    ]:
+        func()
+
+    assert cursor.call_count == 4